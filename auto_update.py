@@ -0,0 +1,312 @@
+import os
+import re
+import subprocess
+
+# --- Configuration ---
+# The name of the folder containing your animation HTML files.
+ANIM_FOLDER = 'Anim'
+# The path to your main library HTML file.
+LIBRARY_FILE = 'Animation Library.html'
+# Sidecar file caching the animation folder's mtime and the remote tip
+# recorded by the last successful run.
+CACHE_FILE = '.auto_update_cache'
+# Extensions recognized as animation files; a tuple lets str.endswith test
+# them all in one C-level call.
+ANIM_EXTENSIONS = ('.html',)
+# --- End of Configuration ---
+
+# Regex to find the 'animationFiles' array in the script tag, compiled once
+# at import so the hot path skips the re-cache lookup on every call.
+# It captures the content between the square brackets.
+_ANIM_ARRAY_RE = re.compile(r"const animationFiles = \[\s*([^\]]*)\s*\];")
+
+# Pulls the quoted paths out of the array body in a single C-level scan,
+# replacing the split/strip chain.
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+
+def get_animation_files_from_disk():
+    """Scans the animation folder and returns a list of HTML file paths."""
+    if not os.path.isdir(ANIM_FOLDER):
+        print(f"Error: Directory '{ANIM_FOLDER}' not found.")
+        return []
+    
+    # Scan the directory, filter by extension, and use the entry paths directly.
+    # scandir gives us cached file-type info without an extra stat per entry.
+    # The backslash fixup is only needed on Windows; on POSIX the paths are
+    # already forward-slashed, so skip the per-entry string copy.
+    with os.scandir(ANIM_FOLDER) as it:
+        if os.sep != '/':
+            return [entry.path.replace("\\", "/") for entry in it
+                    if entry.is_file(follow_symlinks=False) and entry.name.endswith(ANIM_EXTENSIONS)]
+        return [entry.path for entry in it
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith(ANIM_EXTENSIONS)]
+
+def update_library_file(disk_files):
+    """
+    Reads the library file, checks if the list of animations is up-to-date,
+    and updates it if necessary.
+    Returns True if the file was changed, False if it was already
+    up-to-date, or None if the update failed.
+    """
+    try:
+        with open(LIBRARY_FILE, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        print(f"Error: Library file '{LIBRARY_FILE}' not found.")
+        return None
+
+    match = _ANIM_ARRAY_RE.search(content)
+
+    if not match:
+        print("Error: Could not find the 'animationFiles' array in the library file.")
+        return None
+
+    # Extract the file paths currently in the HTML: every entry is a
+    # double-quoted path, so one findall yields the clean list.
+    # The content is in group 1 of the match.
+    html_files = _QUOTED_RE.findall(match.group(1))
+
+    # Compare sorted sequences instead of sets: at the handful of entries a
+    # library holds, sorting beats building two hash tables, and the sorted
+    # disk list is reused as-is when the array is written out. The cheap
+    # length check still runs first since matching contents is the common case.
+    disk_sorted = sorted(disk_files)
+
+    if len(disk_files) == len(html_files) and disk_sorted == sorted(html_files):
+        print("Animation library is already up-to-date.")
+        return False
+
+    # --- File needs to be updated ---
+    print("Updating animation library...")
+
+    # Splice the new array in by writing prefix, array and suffix separately,
+    # avoiding the extra full-file scan and allocation of str.replace. The
+    # quoted filenames are streamed straight to the file handle, so no
+    # intermediate joined string is built either.
+    # Writing to a temp file and renaming it into place keeps the library
+    # intact if the script dies mid-write; the fsync makes the rename durable.
+    start, end = match.span()
+    tmp_file = LIBRARY_FILE + '.tmp'
+
+    try:
+        with open(tmp_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(content[:start])
+            # Each filename is enclosed in double quotes and separated by a
+            # comma and a newline, matching the JavaScript array syntax.
+            f.write("const animationFiles = [\n            ")
+            separator = ""
+            for name in disk_sorted:
+                f.write(separator)
+                f.write(f'"{name}"')
+                separator = ",\n            "
+            f.write("\n        ];")
+            f.write(content[end:])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, LIBRARY_FILE)
+        print(f"Successfully updated '{LIBRARY_FILE}'.")
+        return True
+    except IOError as e:
+        print(f"Error writing to file '{LIBRARY_FILE}': {e}")
+        # Don't leave a stray temp file behind for the next git add to pick up.
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        return None
+
+def probe_local_changes():
+    """
+    Returns (dirty, untracked_files) for the working tree using plumbing
+    instead of porcelain: diff-index exits at the first difference rather
+    than formatting a full status, and ls-files enumerates untracked files
+    (which diff-index cannot see) as NUL-separated raw bytes, so filenames
+    with spaces or newlines parse correctly. The index stat cache must be
+    refreshed first or diff-index reports touched-but-unchanged files as
+    dirty (porcelain status did this refresh implicitly).
+    """
+    subprocess.run(['git', 'update-index', '-q', '--refresh'])
+    dirty = subprocess.run(['git', 'diff-index', '--quiet', 'HEAD', '--']).returncode != 0
+    untracked_result = subprocess.run(
+        ['git', 'ls-files', '--others', '--exclude-standard', '-z'],
+        capture_output=True, check=True)
+    untracked_files = [f for f in untracked_result.stdout.split(b'\0') if f]
+    return dirty, untracked_files
+
+def manage_git_repository():
+    """
+    Stashes local changes, pulls from remote, reapplies changes,
+    and then adds, commits, and pushes if necessary.
+    Returns True if the sync completed, False if a git command failed.
+    """
+    try:
+        # Check if there are any local changes (staged or unstaged).
+        dirty, untracked_files = probe_local_changes()
+        has_local_changes = dirty or bool(untracked_files)
+
+        # Only tracked changes need stashing before the rebase; git stash
+        # ignores untracked files by default, and stash-popping after a
+        # stash that saved nothing would fail.
+        if dirty:
+            print("Local changes detected. Stashing them temporarily...")
+            subprocess.run(['git', 'stash'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+        # Now, pull the latest changes from the remote.
+        # --rebase will prevent messy merge commits for a cleaner history.
+        print("Pulling latest changes from remote repository...")
+        subprocess.run(['git', 'pull', '--rebase'], check=True)
+
+        if not has_local_changes:
+            # A clean tree stays clean through a rebase; no second status needed.
+            print("No git changes to commit after sync.")
+            return True
+
+        if dirty:
+            print("Re-applying stashed changes...")
+            subprocess.run(['git', 'stash', 'pop'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+            # The pulled commits may already contain the stashed change, in
+            # which case the pop leaves a clean tree; re-probe so we don't
+            # run a commit that has nothing to commit.
+            dirty, untracked_files = probe_local_changes()
+            if not dirty and not untracked_files:
+                print("No git changes to commit after sync.")
+                return True
+
+        print("Git changes detected. Preparing to commit...")
+
+        # --- Determine the commit message ---
+        # Newly added files outrank modifications; git paths are always
+        # '/'-separated, so rpartition replaces the heavier
+        # os.path.basename, and only the single chosen filename is ever
+        # decoded.
+        commit_message = "Update animation library" # Default message
+        if untracked_files:
+            commit_message = f"Add {untracked_files[0].rpartition(b'/')[2].decode('utf-8')}"
+        elif dirty:
+            names = subprocess.run(
+                ['git', 'diff-index', '--name-only', '-z', 'HEAD', '--'],
+                capture_output=True, check=True).stdout
+            modified_file = names.split(b'\0', 1)[0]
+            if modified_file:
+                commit_message = f"Update {modified_file.rpartition(b'/')[2].decode('utf-8')}"
+
+        # --- Execute Git Commands ---
+        print(f"Using commit message: '{commit_message}'")
+        if untracked_files:
+            subprocess.run(['git', 'add', '.'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            print("Staged all changes.")
+            subprocess.run(['git', 'commit', '-m', commit_message], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        else:
+            # Only tracked files changed, so -a stages and commits them in a
+            # single git invocation.
+            subprocess.run(['git', 'commit', '-am', commit_message], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        print("Committed changes.")
+        print("Pushing changes to remote repository...")
+        subprocess.run(['git', 'push'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        print("Successfully pushed changes.")
+        return True
+
+    except FileNotFoundError:
+        print("Error: 'git' command not found. Make sure Git is installed and in your PATH.")
+        return False
+    except subprocess.CalledProcessError as e:
+        print(f"An error occurred while running a git command: {e}")
+        # Print the standard error from the command for better debugging.
+        if e.stderr:
+            stderr = e.stderr.decode('utf-8', 'replace') if isinstance(e.stderr, bytes) else e.stderr
+            print(f"Stderr: {stderr.strip()}")
+        else:
+            print("Stderr: Not available.")
+        return False
+
+def read_cache():
+    """Returns the (anim folder mtime, remote sha) stored by the last run."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            mtime_str, _, sha = f.read().partition(' ')
+        return int(mtime_str), sha.strip() or None
+    except (OSError, ValueError):
+        return None, None
+
+def write_cache(anim_mtime, remote_sha):
+    """Persists the folder mtime and remote sha for the next run's fast path."""
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            f.write(f"{anim_mtime} {remote_sha or ''}")
+    except OSError:
+        pass
+
+def get_remote_head():
+    """Returns the sha of the remote HEAD, or None if it cannot be read."""
+    try:
+        result = subprocess.run(['git', 'ls-remote', 'origin', 'HEAD'],
+                                capture_output=True, check=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    sha = result.stdout.split(b'\t', 1)[0].strip()
+    return sha.decode('ascii') if sha else None
+
+def get_local_head():
+    """Returns the sha of the local HEAD, or None if it cannot be read."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'],
+                                capture_output=True, check=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip().decode('ascii') or None
+
+def main():
+    """Main function to run the update process."""
+    print("--- Starting Auto-Update Script ---")
+
+    anim_mtime = os.stat(ANIM_FOLDER).st_mtime_ns if os.path.isdir(ANIM_FOLDER) else None
+    cached_mtime, cached_sha = read_cache()
+    anim_unchanged = (anim_mtime is not None and anim_mtime == cached_mtime
+                      and os.path.isfile(LIBRARY_FILE))
+
+    # Fast path: the animation folder hasn't changed since the last run,
+    # the working tree is clean (the folder mtime misses content edits to
+    # existing files, so the local plumbing probe must agree), and the
+    # remote tip still matches the one recorded after the last sync, so
+    # there is nothing to scan, commit, pull or push. The probe is a few
+    # local microsecond-scale calls; the only network round-trip is the
+    # single ls-remote.
+    if anim_unchanged and cached_sha is not None:
+        try:
+            dirty, untracked_files = probe_local_changes()
+        except (OSError, subprocess.SubprocessError):
+            dirty, untracked_files = True, []
+        if not dirty and not untracked_files and get_remote_head() == cached_sha:
+            print("Nothing to do: animation folder and remote are unchanged.")
+            return
+
+    if anim_unchanged:
+        # The folder mtime still matches, so only the git side needs work.
+        print("Animation library is already up-to-date.")
+        updated = False
+    else:
+        # Step 1: Get the list of animation files from the 'Anim' folder.
+        disk_files = get_animation_files_from_disk()
+        if not disk_files:
+            print("No animation files found on disk. Exiting.")
+            return
+
+        # Step 2: Update the library HTML file if it's out of sync.
+        updated = update_library_file(disk_files)
+
+    # Step 3: Check for any git changes (including the one we might have just made) and push.
+    synced = manage_git_repository()
+
+    # After a successful sync the local HEAD is the remote tip; record it
+    # with the folder state so the next unchanged run exits immediately.
+    # A failed sync or library update (None) leaves the cache stale so the
+    # next run retries in full instead of latching the error.
+    if synced and updated is not None and anim_mtime is not None:
+        write_cache(anim_mtime, get_local_head())
+
+    print("--- Script Finished ---")
+
+
+if __name__ == "__main__":
+    main()
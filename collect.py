@@ -1,4 +1,5 @@
 import os
+import shutil
 
 # === Configuration ===
 whitelist_ext = {'.html'}  # Allowed extensions
@@ -6,37 +7,49 @@ blacklist_ext = {}  # Disallowed extensions
 
 output_file = 'collected_code.txt'
 
-def collect_code(root_dir='.'):
-    collected = []
+def collect_code(root_dir='.', output_file=output_file):
+    count = 0
 
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        for filename in filenames:
-            file_ext = os.path.splitext(filename)[1].lower()
-            
-            # Check whitelist and blacklist
-            if whitelist_ext and file_ext not in whitelist_ext:
-                continue
-            if blacklist_ext and file_ext in blacklist_ext:
-                continue
-            
-            file_path = os.path.join(dirpath, filename)
+    # Stream each matched file straight into the output as it is read, so
+    # peak memory stays at one file instead of the whole tree.
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as out:
+        # Walk the tree with os.scandir directly so DirEntry objects keep
+        # their cached file-type info and paths (avoids the extra join/stat
+        # per file that os.walk incurs).
+        stack = [root_dir]
+        while stack:
+            current_dir = stack.pop()
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                collected.append((file_path, content))
-            except Exception as e:
-                print(f"Failed to read {file_path}: {e}")
-    
-    return collected
-
-def save_to_file(collected, output_file):
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for path, content in collected:
-            f.write(f"=== {path} ===\n")
-            f.write(content)
-            f.write("\n\n")
+                entries = os.scandir(current_dir)
+            except OSError as e:
+                print(f"Failed to scan {current_dir}: {e}")
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+
+                    dot = entry.name.rfind('.')
+                    file_ext = entry.name[dot:].lower() if dot >= 0 else ''
+
+                    # Check whitelist and blacklist
+                    if whitelist_ext and file_ext not in whitelist_ext:
+                        continue
+                    if blacklist_ext and file_ext in blacklist_ext:
+                        continue
+
+                    try:
+                        with open(entry.path, 'r', encoding='utf-8', errors='ignore') as src:
+                            out.write(f"=== {entry.path} ===\n")
+                            shutil.copyfileobj(src, out, length=1 << 20)
+                            out.write("\n\n")
+                        count += 1
+                    except Exception as e:
+                        print(f"Failed to read {entry.path}: {e}")
+
+    return count
 
 if __name__ == "__main__":
-    collected = collect_code()
-    save_to_file(collected, output_file)
-    print(f"Collected {len(collected)} files into {output_file}")
+    count = collect_code()
+    print(f"Collected {count} files into {output_file}")